@@ -1,3 +1,5 @@
+import functools
+
 import polars as pl
 import pint
 from typing import Union, Any
@@ -7,79 +9,136 @@ default_ureg = pint.UnitRegistry()
 Unit = default_ureg.Unit
 Quantity = default_ureg.Quantity
 
+# Registries seen so far, keyed by id(). Parsing a unit string and computing a
+# conversion factor both go through pint's expression parser, which costs
+# hundreds of microseconds per call -- far more than the wrapper itself.
+# Caching per (registry, string) makes repeated unit handling near free.
+_registries: dict = {}
+
+# One dimensionless Unit per registry; ureg.dimensionless resolves through the
+# registry on every access, which adds up on log/exp-heavy pipelines.
+_dimless_units: dict = {}
+
+
+def _register(ureg: pint.UnitRegistry) -> int:
+    ureg_id = id(ureg)
+    if ureg_id not in _registries:
+        _registries[ureg_id] = ureg
+        _dimless_units[ureg_id] = ureg.dimensionless
+    return ureg_id
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_unit(ureg_id: int, name: str):
+    return _registries[ureg_id].Unit(name)
+
+
+@functools.lru_cache(maxsize=1024)
+def _conversion_factor(ureg_id: int, src: str, dst: str) -> float:
+    ureg = _registries[ureg_id]
+    src_unit = ureg.Unit(src)
+    dst_unit = ureg.Unit(dst)
+    if all(
+        ureg._units[name].is_multiplicative
+        for name in (*src_unit._units, *dst_unit._units)
+    ):
+        # Multiplicative units convert by a pure ratio of root-unit factors;
+        # this skips the Quantity allocation and full conversion machinery.
+        src_factor, _ = ureg._get_root_units(src_unit._units)
+        dst_factor, _ = ureg._get_root_units(dst_unit._units)
+        if src_unit.dimensionality != dst_unit.dimensionality:
+            raise pint.DimensionalityError(src_unit, dst_unit)
+        return src_factor / dst_factor
+    # Offset units (degC, degF, ...) need pint's full conversion path
+    return (1 * src_unit).to(dst_unit).magnitude
+
+
+def _as_unit(ureg: pint.UnitRegistry, unit: Union[str, Any]):
+    if isinstance(unit, str):
+        return _parse_unit(_register(ureg), unit)
+    return unit
+
+
+# Methods that require dimensionless quantities
+DIMENSIONLESS_METHODS = frozenset(
+    {
+        "exp",
+        "log",
+        "log10",
+        "log1p",
+        "sin",
+        "cos",
+        "tan",
+        "sinh",
+        "cosh",
+        "tanh",
+        "arcsin",
+        "arccos",
+        "arctan",
+        "arcsinh",
+        "arccosh",
+        "arctanh",
+        "cot",
+        "degrees",
+        "radians",
+        "entropy",
+    }
+)
+
 
 class UExpr:
+    # Pipelines build thousands of transient UExpr nodes; slots keep each one
+    # to a handful of pointers instead of a full instance dict.
+    __slots__ = ("_expr", "unit", "ureg", "_pending_factor", "_is_dimensionless")
+
     def __init__(
         self,
         expr: pl.Expr,
         unit: Union[str, Any],
         unit_registry: pint.UnitRegistry = None,
     ):
-        self.expr = expr
+        self._expr = expr
         self.ureg = unit_registry if unit_registry is not None else default_ureg
-        self.unit = self.ureg.Unit(unit) if isinstance(unit, str) else unit
+        _register(self.ureg)
+        self.unit = _as_unit(self.ureg, unit)
+        # Conversion factors accumulated by to() but not yet applied to expr;
+        # see _materialize().
+        self._pending_factor = 1.0
+        # Checked on every trig/log/exp call; computing it here makes the
+        # check a plain attribute load instead of a pint dimensionality walk.
+        self._is_dimensionless = bool(self.unit.dimensionless)
 
-    def __getattr__(self, name):
-        # Never forward internal or dunder methods
-        if name.startswith("_"):
-            raise AttributeError(
-                f"'{type(self).__name__}' object has no attribute '{name}'"
-            )
-        try:
-            return super().__getattribute__(name)
-        except AttributeError:
-            pass
-        # List of methods that require dimensionless quantities
-        dimensionless_methods = {
-            "exp",
-            "log",
-            "log10",
-            "log1p",
-            "sin",
-            "cos",
-            "tan",
-            "sinh",
-            "cosh",
-            "tanh",
-            "arcsin",
-            "arccos",
-            "arctan",
-            "arcsinh",
-            "arccosh",
-            "arctanh",
-            "cot",
-            "degrees",
-            "radians",
-            "entropy",
-        }
-        if name in dimensionless_methods:
-            self._require_dimensionless(name)
-        attr = getattr(self.expr, name)
-        if callable(attr):
-
-            def method(*args, **kwargs):
-                # Unwrap UExpr arguments to pl.Expr
-                def unwrap(arg):
-                    if isinstance(arg, UExpr):
-                        return arg.expr
-                    return arg
-
-                new_args = tuple(unwrap(a) for a in args)
-                new_kwargs = {k: unwrap(v) for k, v in kwargs.items()}
-                result = attr(*new_args, **new_kwargs)
-                # If result is a pl.Expr, wrap in UExpr with same unit
-                if isinstance(result, pl.Expr):
-                    unit = (
-                        self.unit
-                        if name not in dimensionless_methods
-                        else self.ureg.dimensionless
-                    )
-                    return UExpr(result, unit, unit_registry=self.ureg)
-                return result
-
-            return method
-        else:
-            return attr
+    @classmethod
+    def _new(cls, expr: pl.Expr, unit, ureg: pint.UnitRegistry) -> "UExpr":
+        """Fast constructor for internal call sites.
+
+        Skips the string/None handling in __init__; ``unit`` must already be
+        a pint Unit and ``ureg`` a registry seen by _register().
+        """
+        obj = cls.__new__(cls)
+        obj._expr = expr
+        obj.unit = unit
+        obj.ureg = ureg
+        obj._pending_factor = 1.0
+        obj._is_dimensionless = bool(unit.dimensionless)
+        return obj
+
+    def _materialize(self) -> pl.Expr:
+        """Apply any pending conversion factor and return the pl.Expr.
+
+        Chained conversions like ``a.to(u1).to(u2)`` only multiply their
+        factors together; the single ``expr * factor`` node is emitted here,
+        the first time the expression is actually consumed.
+        """
+        if self._pending_factor != 1.0:
+            self._expr = self._expr * self._pending_factor
+            self._pending_factor = 1.0
+        return self._expr
+
+    @property
+    def expr(self) -> pl.Expr:
+        """The underlying pl.Expr, with any pending conversion applied."""
+        return self._materialize()
 
     # -----------------------
     # Constructors & helpers
@@ -93,15 +152,24 @@ class UExpr:
         Wrap a Polars column as a unit-aware expression.
         """
         ureg = unit_registry if unit_registry is not None else default_ureg
-        return cls(pl.col(name), ureg.Unit(unit), unit_registry=ureg)
+        return cls(pl.col(name), _as_unit(ureg, unit), unit_registry=ureg)
 
     def to(self, new_unit: Union[str, Any]) -> "UExpr":
         """
         Convert this quantity to a new unit by inserting a scalar factor.
         """
-        new_unit = self.ureg.Unit(new_unit) if isinstance(new_unit, str) else new_unit
-        factor = (1 * self.unit).to(new_unit).magnitude  # scalar
-        return UExpr(self.expr * factor, new_unit, unit_registry=self.ureg)
+        new_unit = _as_unit(self.ureg, new_unit)
+        factor = _conversion_factor(_register(self.ureg), str(self.unit), str(new_unit))
+        # A factor of 1.0 would emit a pointless full-column multiply into the
+        # polars plan; drop it. This also makes the conversions inserted by
+        # _binary_op_same_dim / _cmp_same_dim free for equivalent units.
+        if factor == 1.0 and new_unit == self.unit:
+            return self
+        # Accumulate the factor instead of multiplying immediately, so chained
+        # conversions fuse into one multiply when the result is materialized.
+        converted = UExpr._new(self._expr, new_unit, self.ureg)
+        converted._pending_factor = self._pending_factor * factor
+        return converted
 
     @property
     def dimensionality(self):
@@ -109,13 +177,13 @@ class UExpr:
 
     @property
     def is_dimensionless(self) -> bool:
-        return bool(self.unit.dimensionless)
+        return self._is_dimensionless
 
     def _require_dimensionless(self, op_name: str):
-        if not self.is_dimensionless:
+        if not self._is_dimensionless:
             raise pint.DimensionalityError(
                 self.unit,
-                self.ureg.dimensionless,
+                _dimless_units[id(self.ureg)],
                 f"{op_name} requires a dimensionless quantity",
             )
 
@@ -130,11 +198,15 @@ class UExpr:
         return self._binary_op_same_dim(other, lambda a, b: a - b)
 
     def __mul__(self, other) -> "UExpr":
-        if isinstance(other, UExpr):
+        # Exact-type checks first; isinstance only runs as a subclass fallback
+        t = type(other)
+        if t is UExpr or isinstance(other, UExpr):
             new_unit = self.unit * other.unit
-            return UExpr(self.expr * other.expr, new_unit)
-        elif isinstance(other, (int, float)):
-            return UExpr(self.expr * other, self.unit)
+            return UExpr._new(
+                self._materialize() * other._materialize(), new_unit, self.ureg
+            )
+        elif t is int or t is float or isinstance(other, (int, float)):
+            return UExpr._new(self._materialize() * other, self.unit, self.ureg)
         else:
             return NotImplemented
 
@@ -142,44 +214,55 @@ class UExpr:
         return self.__mul__(other)
 
     def __truediv__(self, other) -> "UExpr":
-        if isinstance(other, UExpr):
+        t = type(other)
+        if t is UExpr or isinstance(other, UExpr):
             new_unit = self.unit / other.unit
-            return UExpr(self.expr / other.expr, new_unit)
-        elif isinstance(other, (int, float)):
-            return UExpr(self.expr / other, self.unit)
+            return UExpr._new(
+                self._materialize() / other._materialize(), new_unit, self.ureg
+            )
+        elif t is int or t is float or isinstance(other, (int, float)):
+            return UExpr._new(self._materialize() / other, self.unit, self.ureg)
         else:
             return NotImplemented
 
     def __rtruediv__(self, other):
-        if isinstance(other, (int, float)):
-            new_unit = self.ureg.Unit("dimensionless") / self.unit
-            return UExpr(other / self.expr, new_unit, unit_registry=self.ureg)
+        t = type(other)
+        if t is int or t is float or isinstance(other, (int, float)):
+            new_unit = _as_unit(self.ureg, "dimensionless") / self.unit
+            return UExpr._new(other / self._materialize(), new_unit, self.ureg)
         else:
             return NotImplemented
 
     def __pow__(self, other) -> "UExpr":
-        if isinstance(other, (int, float)):
-            # Raise unit to a power
+        t = type(other)
+        if t is int or t is float or isinstance(other, (int, float)):
+            # Canonicalize common exponents: polars is memory-bound on column
+            # ops, so avoiding the generic pow kernel (or the whole pass) pays.
+            if other == 1:
+                return self
+            if other == 0.5:
+                return self.sqrt()
             new_unit = self.unit**other
-            return UExpr(self.expr**other, new_unit)
+            return UExpr._new(self._materialize() ** other, new_unit, self.ureg)
         else:
             return NotImplemented
 
     def __rpow__(self, other):
-        if isinstance(other, (int, float)):
-            return UExpr(other**self.expr, self.unit)
+        t = type(other)
+        if t is int or t is float or isinstance(other, (int, float)):
+            return UExpr._new(other ** self._materialize(), self.unit, self.ureg)
         else:
             return NotImplemented
 
     def sqrt(self) -> "UExpr":
-        return UExpr(self.expr.sqrt(), self.unit**0.5, unit_registry=self.ureg)
+        return UExpr._new(self._materialize().sqrt(), self.unit**0.5, self.ureg)
 
     def unwrap(self) -> pl.Expr:
         """Return the underlying pl.Expr for DataFrame operations."""
-        return self.expr
+        return self._materialize()
 
     def alias(self, name: str) -> pl.Expr:
-        return self.expr.alias(name)
+        return self._materialize().alias(name)
 
     def __lt__(self, other: "UExpr") -> pl.Expr:
         return self._cmp_same_dim(other, lambda a, b: a < b)
@@ -204,24 +287,27 @@ class UExpr:
         return self._cmp_same_dim(other, lambda a, b: a != b)
 
     def __abs__(self) -> "UExpr":
-        return UExpr(abs(self.expr), self.unit, unit_registry=self.ureg)
+        return UExpr._new(abs(self._materialize()), self.unit, self.ureg)
 
     def __neg__(self) -> "UExpr":
-        return UExpr(-self.expr, self.unit, unit_registry=self.ureg)
+        return UExpr._new(-self._materialize(), self.unit, self.ureg)
 
     def _binary_op_same_dim(self, other, op):
         # Support arithmetic between UExprs with compatible units
-        if isinstance(other, UExpr):
-            # Convert other's unit to self's unit if possible
-            if self.unit != other.unit:
+        t = type(other)
+        if t is UExpr or isinstance(other, UExpr):
+            # Convert other's unit to self's unit if possible. Thanks to the
+            # unit cache, equal unit strings resolve to the identical Unit
+            # object, so the identity check skips pint's __eq__ entirely.
+            if self.unit is not other.unit and self.unit != other.unit:
                 other_converted = other.to(self.unit)
             else:
                 other_converted = other
-            result_expr = op(self.expr, other_converted.expr)
-            return UExpr(result_expr, self.unit, unit_registry=self.ureg)
-        elif isinstance(other, (int, float)):
-            result_expr = op(self.expr, other)
-            return UExpr(result_expr, self.unit, unit_registry=self.ureg)
+            result_expr = op(self._materialize(), other_converted._materialize())
+            return UExpr._new(result_expr, self.unit, self.ureg)
+        elif t is int or t is float or isinstance(other, (int, float)):
+            result_expr = op(self._materialize(), other)
+            return UExpr._new(result_expr, self.unit, self.ureg)
         else:
             raise TypeError(
                 f"Unsupported operand type(s) for operation: '{type(self)}' and '{type(other)}'"
@@ -229,15 +315,105 @@ class UExpr:
 
     def _cmp_same_dim(self, other, op):
         # Support comparisons between UExprs with compatible units
-        if isinstance(other, UExpr):
-            if self.unit != other.unit:
+        t = type(other)
+        if t is UExpr or isinstance(other, UExpr):
+            if self.unit is not other.unit and self.unit != other.unit:
                 other_converted = other.to(self.unit)
             else:
                 other_converted = other
-            return op(self.expr, other_converted.expr)
-        elif isinstance(other, (int, float)):
-            return op(self.expr, other)
+            return op(self._materialize(), other_converted._materialize())
+        elif t is int or t is float or isinstance(other, (int, float)):
+            return op(self._materialize(), other)
         else:
             raise TypeError(
                 f"Unsupported operand type(s) for comparison: '{type(self)}' and '{type(other)}'"
             )
+
+
+# -----------------------
+# pl.Expr method forwarding
+# -----------------------
+#
+# Every public pl.Expr method gets a trampoline compiled onto UExpr at import
+# time. This replaces the previous __getattr__ dispatch, which rebuilt the
+# dimensionless-method set, walked the attribute-lookup fallback chain and
+# allocated a fresh closure on every single call.
+
+
+# pl.Expr methods annotated as returning Expr; their trampolines always wrap
+# and skip the per-call isinstance(result, pl.Expr) check.
+_RETURNS_EXPR = frozenset(
+    name
+    for name in dir(pl.Expr)
+    if not name.startswith("_")
+    and callable(getattr(pl.Expr, name, None))
+    and getattr(getattr(pl.Expr, name), "__annotations__", {}).get("return") == "Expr"
+)
+
+
+def _make_trampoline(name: str, requires_dimensionless: bool):
+    always_expr = name in _RETURNS_EXPR
+
+    if always_expr:
+
+        def method(self, *args, **kwargs):
+            if requires_dimensionless:
+                self._require_dimensionless(name)
+            args = tuple(a._materialize() if isinstance(a, UExpr) else a for a in args)
+            kwargs = {
+                k: v._materialize() if isinstance(v, UExpr) else v
+                for k, v in kwargs.items()
+            }
+            result = getattr(self._materialize(), name)(*args, **kwargs)
+            unit = (
+                _dimless_units[id(self.ureg)] if requires_dimensionless else self.unit
+            )
+            return UExpr._new(result, unit, self.ureg)
+
+    else:
+
+        def method(self, *args, **kwargs):
+            if requires_dimensionless:
+                self._require_dimensionless(name)
+            args = tuple(a._materialize() if isinstance(a, UExpr) else a for a in args)
+            kwargs = {
+                k: v._materialize() if isinstance(v, UExpr) else v
+                for k, v in kwargs.items()
+            }
+            result = getattr(self._materialize(), name)(*args, **kwargs)
+            # If result is a pl.Expr, wrap in UExpr with same unit
+            if isinstance(result, pl.Expr):
+                unit = (
+                    _dimless_units[id(self.ureg)]
+                    if requires_dimensionless
+                    else self.unit
+                )
+                return UExpr._new(result, unit, self.ureg)
+            return result
+
+    method.__name__ = name
+    method.__qualname__ = f"UExpr.{name}"
+    return method
+
+
+def _make_forwarding_property(name: str):
+    def getter(self):
+        return getattr(self._materialize(), name)
+
+    getter.__name__ = name
+    return property(getter)
+
+
+def _install_trampolines():
+    for name in dir(pl.Expr):
+        if name.startswith("_") or name in UExpr.__dict__:
+            continue
+        attr = getattr(pl.Expr, name)
+        if isinstance(attr, property):
+            # Namespaces like .str/.dt/.list are forwarded unwrapped
+            setattr(UExpr, name, _make_forwarding_property(name))
+        elif callable(attr):
+            setattr(UExpr, name, _make_trampoline(name, name in DIMENSIONLESS_METHODS))
+
+
+_install_trampolines()
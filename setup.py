@@ -0,0 +1,26 @@
+"""Optional compiled build of the dispatch layer.
+
+``polars_units.uexpr`` is a thin Python dispatcher whose cost is interpreter
+overhead, not compute. Compiling it with Cython (in pure-Python mode, so the
+source stays a single ``.py`` file) turns every method call into a C-level
+call. The compile is opt-in via ``POLARS_UNITS_CYTHONIZE=1`` at build time;
+without it, or when Cython is unavailable, the package installs and imports
+as plain Python with identical behavior.
+"""
+
+import os
+
+from setuptools import setup
+
+ext_modules = []
+if os.environ.get("POLARS_UNITS_CYTHONIZE"):
+    try:
+        from Cython.Build import cythonize
+    except ImportError:
+        pass
+    else:
+        ext_modules = cythonize(
+            ["polars_units/uexpr.py"], language_level="3", annotate=False
+        )
+
+setup(ext_modules=ext_modules)
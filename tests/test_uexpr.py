@@ -1,3 +1,5 @@
+import math
+
 import polars as pl
 import pytest
 from polars_units import UExpr
@@ -57,6 +59,15 @@ def test_power_and_sqrt():
     assert str(c.unit) == "meter ** 0.5"
 
 
+def test_power_zero_semantics():
+    df = pl.DataFrame({"a": [1.0, None, float("nan"), float("inf")]})
+    a = UExpr.col("a", "meter")
+    result = df.with_columns((a**0).alias("pow0"))
+    assert (a**0).is_dimensionless
+    # Nulls propagate; nan and inf follow IEEE x**0 == 1
+    assert result["pow0"].to_list() == [1.0, None, 1.0, 1.0]
+
+
 def test_comparisons():
     a = UExpr.col("a", "meter")
     b = UExpr.col("b", "meter")
@@ -95,6 +106,47 @@ def test_aggregations():
     assert str(a.max().unit) == "meter"
 
 
+def test_conversion_between_distinct_roots():
+    df = pl.DataFrame({"theta": [180.0]})
+    theta = UExpr.col("theta", "degree")
+    result = df.select(theta.to("dimensionless").alias("rad"))
+    assert result["rad"][0] == pytest.approx(math.pi)
+
+    a = UExpr.col("a", "radian")
+    assert a.to("dimensionless")._pending_factor == pytest.approx(1.0)
+
+
+def test_conversion_identity_is_noop():
+    a = UExpr.col("a", "meter")
+    assert a.to("meter") is a
+
+
+def test_conversion_round_trip_emits_no_multiply():
+    a = UExpr.col("a", "meter")
+    round_trip = a.to("km").to("meter")
+    assert str(round_trip.unit) == "meter"
+    assert round_trip.unwrap().meta.eq(pl.col("a"))
+    df = pl.DataFrame({"a": [1.0, 2.0]})
+    assert df.select(round_trip.alias("a"))["a"].to_list() == [1.0, 2.0]
+
+
+def test_chained_conversions_fuse_into_single_multiply():
+    a = UExpr.col("a", "meter")
+    chained = a.to("km").to("cm")
+    assert str(chained.unit) == "centimeter"
+    assert str(chained.unwrap()).count("*") == 1
+    df = pl.DataFrame({"a": [1.0, 2.0]})
+    result = df.select(chained.alias("cm"))
+    assert result["cm"].to_list() == pytest.approx([100.0, 200.0])
+
+
+def test_expr_attribute_carries_pending_conversion():
+    df = pl.DataFrame({"d": [1.0]})
+    converted = UExpr.col("d", "meter").to("km")
+    result = df.select(converted.expr.alias("km"))
+    assert result["km"][0] == pytest.approx(0.001)
+
+
 def test_alias_repr():
     a = UExpr.col("a", "meter")
     expr = a.alias("distance")